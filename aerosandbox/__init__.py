@@ -1,16 +1,68 @@
 from .common import *
-from .atmosphere import *
-from .aerodynamics import *
-from .geometry import *
 import aerosandbox.numpy as numpy
-from .modeling import *
 from .optimization import *
-from .performance import *
-from .propulsion import *
-from .structures import *
 
 __version__ = "3.0.17"
 
+### The remaining subpackages pull in heavy dependencies (plotly, matplotlib, scipy, etc.), so they are imported lazily
+# on first attribute access (PEP 562) rather than at `import aerosandbox` time. Their public names are looked up at
+# that point, so that `asb.X` works for anything that `from .subpackage import *` would have brought in.
+_lazy_subpackages = [  # In dependency order, which is the order that they used to be star-imported.
+    "atmosphere",
+    "aerodynamics",
+    "geometry",
+    "modeling",
+    "performance",
+    "propulsion",
+    "structures",
+]
+
+
+def _public_names(module):
+    """
+    Returns the names that `from module import *` would import.
+    """
+    try:
+        return module.__all__
+    except AttributeError:
+        return [name for name in vars(module) if not name.startswith("_")]
+
+
+def __getattr__(name):
+    import importlib
+    import importlib.util
+
+    if name == "__all__":  # Only needed for `from aerosandbox import *`, which has to import everything anyway.
+        names = set(k for k in globals() if not k.startswith("_"))
+        for subpackage in _lazy_subpackages:
+            names.update(_public_names(importlib.import_module(f".{subpackage}", __name__)))
+        value = sorted(names)
+
+    elif name.startswith("__"):  # Don't import everything just because some tool probed for a dunder attribute.
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    elif name in _lazy_subpackages or importlib.util.find_spec(f".{name}", __name__) is not None:
+        value = importlib.import_module(f".{name}", __name__)  # A subpackage or submodule, e.g., `asb.visualization`
+
+    else:
+        # Search the subpackages in dependency order, importing each only when it's reached. Some of them import names
+        # from `aerosandbox` as they initialize (e.g., `performance` needs `Atmosphere`); searching in this order means
+        # that such a name is found before any subpackage that depends on the one still initializing gets imported.
+        for subpackage in _lazy_subpackages:
+            module = importlib.import_module(f".{subpackage}", __name__)
+            if name in _public_names(module):
+                value = getattr(module, name)
+                break
+        else:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    globals()[name] = value  # Cache it, so that __getattr__ is only hit on first access.
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_lazy_subpackages))
+
 
 def docs():
     """
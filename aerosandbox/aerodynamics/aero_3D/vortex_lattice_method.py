@@ -1,5 +1,6 @@
 from aerosandbox import ImplicitAnalysis
 from aerosandbox.geometry import *
+from aerosandbox.visualization import grid_to_quads, circular_rings
 
 
 class VortexLatticeMethod(ImplicitAnalysis):
@@ -677,58 +678,40 @@ class VortexLatticeMethod(ImplicitAnalysis):
 
         fig = Figure3D()
 
-        for index in range(len(front_left_vertices)):
-            fig.add_quad(
-                points=[
-                    front_left_vertices[index, :],
-                    front_right_vertices[index, :],
-                    back_right_vertices[index, :],
-                    back_left_vertices[index, :],
-                ],
-                intensity=data_to_plot[index],
-                outline=True,
-            )
-            # fig.add_line( # Don't draw the quarter-chords
-            #     points=[
-            #         left_vortex_vertices[index],
-            #         right_vortex_vertices[index]
-            #     ],
-            # )
+        fig.add_quads(
+            points=np.stack([
+                front_left_vertices,
+                front_right_vertices,
+                back_right_vertices,
+                back_left_vertices,
+            ], axis=1),
+            intensity=np.reshape(np.array(data_to_plot), -1),
+            outline=True,
+        )
+        # for index in range(len(front_left_vertices)):
+        #     fig.add_line( # Don't draw the quarter-chords
+        #         points=[
+        #             left_vortex_vertices[index],
+        #             right_vortex_vertices[index]
+        #         ],
+        #     )
 
         # Fuselages
         for fuse_id in range(len(self.airplane.fuselages)):
             fuse = self.airplane.fuselages[fuse_id]  # type: Fuselage
 
-            for xsec_id in range(len(fuse.xsecs) - 1):
-                xsec_1 = fuse.xsecs[xsec_id]  # type: FuselageXSec
-                xsec_2 = fuse.xsecs[xsec_id + 1]  # type: FuselageXSec
-
-                r1 = xsec_1.radius
-                r2 = xsec_2.radius
-                points_1 = np.zeros((fuse.circumferential_panels, 3))
-                points_2 = np.zeros((fuse.circumferential_panels, 3))
-                for point_index in range(fuse.circumferential_panels):
-                    rot = rotation_matrix_angle_axis(
-                        2 * cas.pi * point_index / fuse.circumferential_panels,
-                        [1, 0, 0],
-                        True
-                    ).toarray()
-                    points_1[point_index, :] = rot @ np.array([0, 0, r1])
-                    points_2[point_index, :] = rot @ np.array([0, 0, r2])
-                points_1 = points_1 + np.array(fuse.xyz_le).reshape(-1) + np.array(xsec_1.xyz_c).reshape(-1)
-                points_2 = points_2 + np.array(fuse.xyz_le).reshape(-1) + np.array(xsec_2.xyz_c).reshape(-1)
-
-                for point_index in range(fuse.circumferential_panels):
-
-                    fig.add_quad(points=[
-                        points_1[(point_index) % fuse.circumferential_panels, :],
-                        points_1[(point_index + 1) % fuse.circumferential_panels, :],
-                        points_2[(point_index + 1) % fuse.circumferential_panels, :],
-                        points_2[(point_index) % fuse.circumferential_panels, :],
-                    ],
-                        intensity=0,
-                        mirror=fuse.symmetric,
-                    )
+            rings = circular_rings(
+                centers=np.stack([np.array(xsec.xyz_c).reshape(-1) for xsec in fuse.xsecs], axis=0) +
+                        np.array(fuse.xyz_le).reshape(-1),
+                radii=[xsec.radius for xsec in fuse.xsecs],
+                n_points=fuse.circumferential_panels,
+            )  # Shape: (n_xsecs, circumferential_panels, 3)
+
+            fig.add_quads(
+                points=grid_to_quads(rings, periodic=True),
+                intensity=0,
+                mirror=fuse.symmetric,
+            )
 
         if draw_streamlines:
             if (not hasattr(self, 'streamlines')) or recalculate_streamlines:
@@ -1,8 +1,8 @@
 from aerosandbox import AeroSandboxObject
 from aerosandbox.geometry.common import *
 from typing import List
-from aerosandbox.visualization.plotly_Figure3D import Figure3D
-from numpy import pi
+from aerosandbox.visualization.plotly_Figure3D import Figure3D, grid_to_quads, circular_rings
+import casadi as cas
 
 
 class Airplane(AeroSandboxObject):
@@ -75,61 +75,35 @@ class Airplane(AeroSandboxObject):
 
         # Wings
         for wing_id, wing in enumerate(self.wings):
-            for inner_xsec, outer_xsec in zip(wing.xsecs[:-1], wing.xsecs[1:]):
-
-                le_inner = inner_xsec.xyz_le + wing.xyz_le
-                te_inner = inner_xsec.xyz_te() + wing.xyz_le
-                le_outer = outer_xsec.xyz_le + wing.xyz_le
-                te_outer = outer_xsec.xyz_te() + wing.xyz_le
-
-                fig.add_quad(points=[
-                    le_inner,
-                    le_outer,
-                    te_outer,
-                    te_inner
-                ],
-                    intensity=wing_id,
-                    mirror=wing.symmetric,
+            le = np.stack([xsec.xyz_le for xsec in wing.xsecs], axis=0) + wing.xyz_le
+            te = np.stack([xsec.xyz_te() for xsec in wing.xsecs], axis=0) + wing.xyz_le
+
+            fig.add_quads(
+                points=grid_to_quads(np.stack([le, te], axis=0)),
+                intensity=wing_id,
+                mirror=wing.symmetric,
+            )
+            if draw_quarter_chord:
+                fig.add_line(  # draw the quarter-chord line
+                    points=0.75 * le + 0.25 * te,
+                    mirror=wing.symmetric
                 )
-                if draw_quarter_chord:
-                    fig.add_line(  # draw the quarter-chord line
-                        points=[
-                            0.75 * le_inner + 0.25 * te_inner,
-                            0.75 * le_outer + 0.25 * te_outer,
-                        ],
-                        mirror=wing.symmetric
-                    )
 
         # Fuselages
         for fuse_id, fuse in enumerate(self.fuselages):
 
-            for front_xsec, back_xsec in zip(fuse.xsecs[:-1], fuse.xsecs[1:]):
-                r_front = front_xsec.radius
-                r_back = back_xsec.radius
-                points_front = np.zeros((fuse.circumferential_panels, 3))
-                points_rear = np.zeros((fuse.circumferential_panels, 3))
-                for point_index in range(fuse.circumferential_panels):
-                    rot = np.rotation_matrix_3D(
-                        2 * pi * point_index / fuse.circumferential_panels,
-                        [1, 0, 0],
-                        _axis_already_normalized=True
-                    )
-                    points_front[point_index, :] = rot @ np.array([0, 0, r_front])
-                    points_rear[point_index, :] = rot @ np.array([0, 0, r_back])
-                points_front = points_front + np.array(fuse.xyz_le).reshape(-1) + np.array(front_xsec.xyz_c).reshape(-1)
-                points_rear = points_rear + np.array(fuse.xyz_le).reshape(-1) + np.array(back_xsec.xyz_c).reshape(-1)
-
-                for point_index in range(fuse.circumferential_panels):
-
-                    fig.add_quad(points=[
-                        points_front[(point_index) % fuse.circumferential_panels, :],
-                        points_front[(point_index + 1) % fuse.circumferential_panels, :],
-                        points_rear[(point_index + 1) % fuse.circumferential_panels, :],
-                        points_rear[(point_index) % fuse.circumferential_panels, :],
-                    ],
-                        intensity=fuse_id,
-                        mirror=fuse.symmetric,
-                    )
+            rings = circular_rings(
+                centers=np.stack([np.array(xsec.xyz_c).reshape(-1) for xsec in fuse.xsecs], axis=0) +
+                        np.array(fuse.xyz_le).reshape(-1),
+                radii=[xsec.radius for xsec in fuse.xsecs],
+                n_points=fuse.circumferential_panels,
+            )  # Shape: (n_xsecs, circumferential_panels, 3)
+
+            fig.add_quads(
+                points=grid_to_quads(rings, periodic=True),
+                intensity=fuse_id,
+                mirror=fuse.symmetric,
+            )
 
         return fig.draw(
             show=show,
@@ -142,24 +116,9 @@ class Airplane(AeroSandboxObject):
         Returns a boolean describing whether the airplane is geometrically entirely symmetric across the XZ-plane.
         :return: [boolean]
         """
-        for wing in self.wings:
-            if not wing.is_entirely_symmetric():
-                return False
-            for xsec in wing.xsecs:
-                if not (xsec.control_surface_is_symmetric or xsec.control_surface_deflection == 0):
-                    return False
-                if not wing.symmetric:
-                    if not xsec.xyz_le[1] == 0:
-                        return False
-                    if not xsec.twist == 0:
-                        if not (xsec.twist_axis[0] == 0 and xsec.twist_axis[2] == 0):
-                            return False
-                    if not xsec.airfoil.CL_function(0, 1e6, 0, 0) == 0:
-                        return False
-                    if not xsec.airfoil.Cm_function(0, 1e6, 0, 0) == 0:
-                        return False
-
-        return True
+        # Wing.is_entirely_symmetric() also checks the control surfaces of every xsec, and is False for any wing with
+        # symmetric=False (even one lying in the XZ plane, like a vertical tail).
+        return all(wing.is_entirely_symmetric() for wing in self.wings)
 
     def aerodynamic_center(self, chord_fraction: float = 0.25):
         """
@@ -179,14 +138,21 @@ class Airplane(AeroSandboxObject):
         wing_areas = [wing.area(type="projected") for wing in self.wings]
         ACs = [wing.aerodynamic_center() for wing in self.wings]
 
-        wing_AC_area_products = [
-            AC * area
-            for AC, area in zip(
-                ACs,
-                wing_areas
-            )
-        ]
-
-        aerodynamic_center = sum(wing_AC_area_products) / sum(wing_areas)
+        if not is_casadi_type([wing_areas, ACs], recursive=True):
+            wing_areas_array = np.array(wing_areas)
+            ACs_array = np.stack(ACs, axis=0)
+            if wing_areas_array.dtype != object and ACs_array.dtype != object:
+                # Purely numeric, so skip building a symbolic expression and do the area-weighted average in NumPy.
+                return np.sum(ACs_array * wing_areas_array.reshape(-1, 1), axis=0) / np.sum(wing_areas_array)
+
+        # Symbolic, so build the area-weighted average as a single (3, N) x (N, 1) product rather than a sum of N terms.
+        areas = cas.vertcat(*wing_areas)
+        weights = areas / cas.sum1(areas)
+        ACs_matrix = cas.horzcat(*[
+            AC if is_casadi_type(AC) else cas.vertcat(*AC)
+            for AC in ACs
+        ])  # Shape: (3, N)
+
+        aerodynamic_center = cas.mtimes(ACs_matrix, weights)
 
         return aerodynamic_center
@@ -64,8 +64,10 @@ class Wing(AeroSandboxObject):
 
         sectional_spans = []
 
-        for inner_xsec, outer_xsec in zip(self.xsecs[:-1], self.xsecs[1:]):
-            quarter_chord_vector = outer_xsec.quarter_chord() - inner_xsec.quarter_chord()
+        quarter_chords = [xsec.quarter_chord() for xsec in self.xsecs]  # Each xsec bounds two sections; compute once.
+
+        for inner_quarter_chord, outer_quarter_chord in zip(quarter_chords[:-1], quarter_chords[1:]):
+            quarter_chord_vector = outer_quarter_chord - inner_quarter_chord
 
             if type == "wetted":
                 section_span = (
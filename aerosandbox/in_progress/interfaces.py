@@ -1,3 +1,7 @@
+import aerosandbox.numpy as np
+import io
+
+
 def write_aswing(airplane, filepath=None):
     """
     Contributed by Brent Avery, Edited by Peter Sharpe. Work in progress.
@@ -7,246 +11,164 @@ def write_aswing(airplane, filepath=None):
     """
     if filepath is None:
         filepath = "%s.asw" % airplane.name
-    with open(filepath, "w+") as f:
-        f.write('\n'.join(['#============',  # Name of Plane
-                           'Name',
-                           airplane.name,
-                           'End']))
-        f.write('\n'.join(['', '#============',  # Units that the analysis would be in, usually metric
-                           'Units',
-                           'L 0.3048 m',
-                           'T 1.0  s',
-                           'F 4.450 N',
-                           'End']))
-        f.write('\n'.join(['', '#============',  # Value of constants (cant imagine these changing too much)
-                           'Constant',
-                           '#  g     rho_0     a_0',
-                           '   '.join([str(9.81), str(1.205), str(343.3)]),
-                           'End']))
-        f.write('\n'.join(['', '#============',  # Reference values (change automatically with input file)
-                           'Reference',
-                           '#   Sref    Cref    Bref',
-                           '   '.join([str(airplane.s_ref), str(airplane.c_ref), str(airplane.b_ref)]),
-                           'End']))
-
-        '''
-        Ok so 'ground' is a point on the plane that is constrained from translation or rotation.   
-        Based on the documentation this is usually the 'frontest' part of the aircraft (why do I suck at words).   
-        There is definitely a much better way to do this and I'm working on it but right now I'm just assuming   
-        that it is the front part of the main wing, and just make that a constraint in AeroSandBox
-        '''
-        f.write('\n'.join(['', '#============',
-                           'Ground',
-                           '#  Nbeam  t',
-                           '    '.join([' ', str(1), str(0)]),
-                           'End']))
-
-        f.write('\n'.join(['', '#============',
-                           'Joint',
-                           '#   Nbeam1   Nbeam2    t1     t2']))
-        for onewing in range(1, len(airplane.wings)):
-            wing = airplane.wings[onewing]
-            if wing.name == "Horizontal Stabilizer":
-                xsecs = []
-                for xsec in wing.xsecs:
-                    xsecs.append(xsec)
-                t = xsecs[0].y_le + wing.xyz_le[1]
-                coords = '       '.join(['    1', str(onewing + 1), str(t), '0'])
-                f.write('\n'.join(['', coords]))
-            if wing.name == "Vertical Stabilizer":
-                wing2 = airplane.wings[int(np.ceil(onewing / 2))]
-                wing3 = airplane.wings[0]
-                xsecs = []
-                for xsec in wing.xsecs:
-                    xsecs.append(xsec)
-                xsecs2 = []
-                for xsec2 in wing2.xsecs:
-                    xsecs2.append(xsec2)
-                xsecs3 = []
-                for xsec3 in wing3.xsecs:
-                    xsecs3.append(xsec3)
-                t = xsecs2[0].y_le + wing.xyz_le[1]
-                t2 = 1 + (xsecs2[0].z_le + wing2.xyz_le[2]) - (xsecs[0].z_le + wing.xyz_le[2])
-                coords = '       '.join(['    1', str(onewing + 1), str(t), str(t2)])
-                f.write('\n'.join(['', coords]))
-
-        for fuse in range(len(airplane.fuselages)):
-            onefuse = airplane.fuselages[fuse]
-            wing = airplane.wings[0]
-            xsecs = []
-            xsecs.append(onefuse.xsecs[0])
-            xsecs.append(onefuse.xsecs[-1])
-            xsecs2 = []
-            for xsec2 in wing.xsecs:
-                xsecs2.append(xsec2)
-            t = xsecs[0].y_c + onefuse.xyz_le[1]
-            t2 = ((wing.xyz_le[0] + xsecs2[0].x_le) + (wing.xyz_le[0] + xsecs2[-1].x_le)) / 2
-            coords = '      '.join(['    1', str(onewing + fuse + 2), str(t), str(t2)])
-            f.write('\n'.join(['', coords]))
-
-        corr_stab = {}
-
-        for fuse in range(len(airplane.fuselages)):
-            corr_stab.update({fuse + len(airplane.wings) + 1: [fuse + 1, fuse + 1 + np.floor(len(airplane.wings) / 2)]})
-
-        for fuse in range(len(airplane.fuselages)):
-            onefuse = airplane.fuselages[fuse]
-            xsecs = []
-            xsecs.append(onefuse.xsecs[0])
-            xsecs.append(onefuse.xsecs[-1])
-            horiz = airplane.wings[corr_stab[fuse + len(airplane.wings) + 1][0]]
-            xsecs2 = []
-            for xsec2 in horiz.xsecs:
-                xsecs2.append(xsec2)
-            vert = airplane.wings[int(corr_stab[fuse + len(airplane.wings) + 1][1])]
-            xsecs3 = []
-            for xsec3 in vert.xsecs:
-                xsecs3.append(xsec3)
-            t = xsecs2[0].x_le + horiz.xyz_le[0]
-            t2 = 0
-            t3 = xsecs3[0].x_le + vert.xyz_le[0]
-            t4 = 1 + (xsecs2[0].z_le + horiz.xyz_le[2]) - (xsecs3[0].z_le + vert.xyz_le[2])
-            coords = '     '.join(
-                ['', str(fuse + len(airplane.wings) + 1), str(corr_stab[fuse + len(airplane.wings) + 1][0] + 1), str(t),
-                 str(t2)])
-            coords2 = '     '.join(
-                ['', str(fuse + len(airplane.wings) + 1), str(corr_stab[fuse + len(airplane.wings) + 1][1] + 1), str(t3),
-                 str(t4)])
-            f.write('\n'.join(['', coords, coords2]))
-        f.write('\n'.join(['', 'End']))
-        '''
-        The juicy stuff! This part of the code iterates over each wing and then subiterates (is that a word?) over 
-        each wing's cross section. Along the way it collects information on chord length, angle, and coordinates of
-        all the leading edges. It then writes all this info in a way that ASWing likes
-        '''
-        for onewing in range(len(airplane.wings)):
-            wing = airplane.wings[onewing]
-            if wing.name == "Main Wing":
-                xsecs = []
-                for xsec in wing.xsecs:
-                    xsecs.append(xsec)
-                chordalfa = []
-                coords = []
-                '''
-                This part is hard to explain but basically I defined t (the beamwise axis)
-                as the axis that the beam changes most along. This can be generalized
-                but I'm not entirely sure how
-                '''
-                max_le = {abs(xsecs[-1].x_le - xsecs[0].x_le): 'sec.x_le', \
-                          abs(xsecs[-1].y_le - xsecs[0].y_le): 'sec.y_le', \
-                          abs(xsecs[-1].z_le - xsecs[0].z_le): 'sec.z_le'}
-                for sec in xsecs:
-                    if max_le.get(max(max_le)) == 'sec.x_le':
-                        t = sec.x_le
-                    elif max_le.get(max(max_le)) == 'sec.y_le':
-                        t = sec.y_le
-                    elif max_le.get(max(max_le)) == 'sec.z_le':
-                        t = sec.z_le
-                    chordalfa.append('    '.join([str(t), str(sec.chord), str(sec.twist)]))
-                    coords.append(
-                        '    '.join([str(t), str(sec.x_le + wing.xyz_le[0]), str(sec.y_le + wing.xyz_le[1]),
-                                     str(sec.z_le + wing.xyz_le[2])]))
-                f.write('\n'.join(['', '#============',
-                                   ' '.join(['Beam', str(onewing + 1)]),
-                                   wing.name,
-                                   't    chord    twist',
-                                   '\n'.join(chordalfa),
-                                   '#',
-                                   't    x    y    z',
-                                   '\n'.join(coords),
-                                   'End']))
-            elif wing.name == "Horizontal Stabilizer":
-                xsecs = []
-                for xsec in wing.xsecs:
-                    xsecs.append(xsec)
-                chordalfa = []
-                coords = []
-                '''
-                This part is hard to explain but basically I defined t (the beamwise axis)
-                as the axis that the beam changes most along. This can be generalized
-                but I'm not entirely sure how
-                '''
-                max_le = {abs(xsecs[-1].x_le - xsecs[0].x_le): 'sec.x_le', \
-                          abs(xsecs[-1].y_le - xsecs[0].y_le): 'sec.y_le', \
-                          abs(xsecs[-1].z_le - xsecs[0].z_le): 'sec.z_le'}
-                for sec in xsecs:
-                    if max_le.get(max(max_le)) == 'sec.x_le':
-                        t = sec.x_le
-                    elif max_le.get(max(max_le)) == 'sec.y_le':
-                        t = sec.y_le
-                    elif max_le.get(max(max_le)) == 'sec.z_le':
-                        t = sec.z_le
-                    chordalfa.append('    '.join([str(t), str(sec.chord), str(sec.twist), str(0.07)]))
-                    coords.append(
-                        '    '.join([str(t), str(sec.x_le + wing.xyz_le[0]), str(sec.y_le + wing.xyz_le[1]),
-                                     str(sec.z_le + wing.xyz_le[2])]))
-                f.write('\n'.join(['', '#============',
-                                   ' '.join(['Beam', str(onewing + 1)]),
-                                   wing.name,
-                                   't    chord    twist dCLdF1',
-                                   '\n'.join(chordalfa),
-                                   '#',
-                                   't    x    y    z',
-                                   '\n'.join(coords),
-                                   'End']))
-
-            elif wing.name == "Vertical Stabilizer":
-                xsecs = []
-                for xsec in wing.xsecs:
-                    xsecs.append(xsec)
-                chordalfa = []
-                coords = []
-                '''
-                This part is hard to explain but basically I defined t (the beamwise axis)
-                as the axis that the beam changes most along. This can be generalized
-                but I'm not entirely sure how
-                '''
-                max_le = {abs(xsecs[-1].x_le - xsecs[0].x_le): 'sec.x_le', \
-                          abs(xsecs[-1].y_le - xsecs[0].y_le): 'sec.y_le', \
-                          abs(xsecs[-1].z_le - xsecs[0].z_le): 'sec.z_le'}
-                for sec in xsecs:
-                    if max_le.get(max(max_le)) == 'sec.x_le':
-                        t = sec.x_le + 1
-                    elif max_le.get(max(max_le)) == 'sec.y_le':
-                        t = sec.y_le + 1
-                    elif max_le.get(max(max_le)) == 'sec.z_le':
-                        t = sec.z_le + 1
-                    chordalfa.append('    '.join([str(t), str(sec.chord), str(sec.twist)]))
-                    coords.append(
-                        '    '.join([str(t), str(sec.x_le + wing.xyz_le[0]), str(sec.y_le + wing.xyz_le[1]),
-                                     str(sec.z_le + wing.xyz_le[2])]))
-                f.write('\n'.join(['', '#============',
-                                   ' '.join(['Beam', str(onewing + 1)]),
-                                   wing.name,
-                                   '  t    chord    twist',
-                                   '\n'.join(chordalfa),
-                                   '#',
-                                   't    x    y    z',
-                                   '\n'.join(coords),
-                                   'End']))
-
-        for fuse in range(len(airplane.fuselages)):
-            onefuse = airplane.fuselages[fuse]
-            xsecs = []
-            xsecs.append(onefuse.xsecs[0])
-            xsecs.append(onefuse.xsecs[-1])
-            coords = []
-            max_c = {abs(xsecs[1].x_c - xsecs[0].x_c): 'sec.x_c', \
-                     abs(xsecs[1].y_c - xsecs[0].y_c): 'sec.y_c', \
-                     abs(xsecs[1].z_c - xsecs[0].z_c): 'sec.z_c'}
-            for sec in xsecs:
-                if max_c.get(max(max_c)) == 'sec.x_c':
-                    t = sec.x_c
-                elif max_c.get(max(max_c)) == 'sec.y_c':
-                    t = sec.y_c
-                elif max_c.get(max(max_c)) == 'sec.z_c':
-                    t = sec.z_c
-                coords.append(
-                    '    '.join([str(t), str(sec.x_c + onefuse.xyz_le[0]), str(sec.y_c + onefuse.xyz_le[1]),
-                                 str(sec.z_c + onefuse.xyz_le[2])]))
-            f.write('\n'.join(['', '#============',
-                               '  '.join(['Beam', str(onewing + fuse + 2)]),
-                               onefuse.name,
-                               't    x    y    z',
-                               '\n'.join(coords),
-                               'End']))
+
+    out = []  # Lines of the file; written out all at once at the end.
+
+    out.extend(['#============',  # Name of Plane
+                'Name',
+                airplane.name,
+                'End'])
+    out.extend(['#============',  # Units that the analysis would be in, usually metric
+                'Units',
+                'L 0.3048 m',
+                'T 1.0  s',
+                'F 4.450 N',
+                'End'])
+    out.extend(['#============',  # Value of constants (cant imagine these changing too much)
+                'Constant',
+                '#  g     rho_0     a_0',
+                f'{9.81}   {1.205}   {343.3}',
+                'End'])
+    out.extend(['#============',  # Reference values (change automatically with input file)
+                'Reference',
+                '#   Sref    Cref    Bref',
+                f'{airplane.s_ref}   {airplane.c_ref}   {airplane.b_ref}',
+                'End'])
+
+    '''
+    Ok so 'ground' is a point on the plane that is constrained from translation or rotation.   
+    Based on the documentation this is usually the 'frontest' part of the aircraft (why do I suck at words).   
+    There is definitely a much better way to do this and I'm working on it but right now I'm just assuming   
+    that it is the front part of the main wing, and just make that a constraint in AeroSandBox
+    '''
+    out.extend(['#============',
+                'Ground',
+                '#  Nbeam  t',
+                '     1    0',
+                'End'])
+
+    out.extend(['#============',
+                'Joint',
+                '#   Nbeam1   Nbeam2    t1     t2'])
+    for onewing in range(1, len(airplane.wings)):
+        wing = airplane.wings[onewing]
+        if wing.name == "Horizontal Stabilizer":
+            t = wing.xsecs[0].xyz_le[1] + wing.xyz_le[1]
+            out.append(f'    1       {onewing + 1}       {t}       0')
+        if wing.name == "Vertical Stabilizer":
+            wing2 = airplane.wings[-(-onewing // 2)]
+            t = wing2.xsecs[0].xyz_le[1] + wing.xyz_le[1]
+            t2 = 1 + (wing2.xsecs[0].xyz_le[2] + wing2.xyz_le[2]) - (wing.xsecs[0].xyz_le[2] + wing.xyz_le[2])
+            out.append(f'    1       {onewing + 1}       {t}       {t2}')
+
+    for fuse in range(len(airplane.fuselages)):
+        onefuse = airplane.fuselages[fuse]
+        wing = airplane.wings[0]
+        t = onefuse.xsecs[0].y_c + onefuse.xyz_le[1]
+        t2 = ((wing.xyz_le[0] + wing.xsecs[0].xyz_le[0]) + (wing.xyz_le[0] + wing.xsecs[-1].xyz_le[0])) / 2
+        out.append(f'    1      {len(airplane.wings) + fuse + 1}      {t}      {t2}')
+
+    half_wings = len(airplane.wings) // 2
+    for fuse in range(len(airplane.fuselages)):
+        fuse_beam = len(airplane.wings) + fuse + 1
+        horiz_index = fuse + 1
+        vert_index = fuse + 1 + half_wings  # The stabilizers that correspond to this fuselage
+        horiz = airplane.wings[horiz_index]
+        vert = airplane.wings[vert_index]
+        t = horiz.xsecs[0].xyz_le[0] + horiz.xyz_le[0]
+        t2 = 0
+        t3 = vert.xsecs[0].xyz_le[0] + vert.xyz_le[0]
+        t4 = 1 + (horiz.xsecs[0].xyz_le[2] + horiz.xyz_le[2]) - (vert.xsecs[0].xyz_le[2] + vert.xyz_le[2])
+        out.extend([
+            f'     {fuse_beam}     {horiz_index + 1}     {t}     {t2}',
+            f'     {fuse_beam}     {vert_index + 1}     {t3}     {t4}',
+        ])
+    out.append('End')
+    '''
+    The juicy stuff! This part of the code iterates over each wing and then subiterates (is that a word?) over 
+    each wing's cross section. Along the way it collects information on chord length, angle, and coordinates of
+    all the leading edges. It then writes all this info in a way that ASWing likes
+    '''
+    for onewing in range(len(airplane.wings)):
+        wing = airplane.wings[onewing]
+        if wing.name == "Main Wing":
+            out.extend(_beam_lines(wing, beam_number=onewing + 1,
+                                   chordalfa_header='t    chord    twist'))
+        elif wing.name == "Horizontal Stabilizer":
+            out.extend(_beam_lines(wing, beam_number=onewing + 1,
+                                   chordalfa_header='t    chord    twist dCLdF1',
+                                   extra_column=0.07))
+        elif wing.name == "Vertical Stabilizer":
+            out.extend(_beam_lines(wing, beam_number=onewing + 1,
+                                   chordalfa_header='  t    chord    twist',
+                                   t_offset=1))
+
+    for fuse in range(len(airplane.fuselages)):
+        onefuse = airplane.fuselages[fuse]
+        xsecs = [onefuse.xsecs[0], onefuse.xsecs[-1]]
+        out.extend(['#============',
+                    f'Beam  {len(airplane.wings) + fuse + 1}',
+                    onefuse.name,
+                    't    x    y    z'])
+        t_axis = int(np.argmax(np.abs(xsecs[1].xyz_c - xsecs[0].xyz_c)))  # The axis the fuselage changes most along
+        for sec in xsecs:
+            t = sec.xyz_c[t_axis]
+            out.append(
+                f'{t}    {sec.x_c + onefuse.xyz_le[0]}    {sec.y_c + onefuse.xyz_le[1]}    {sec.z_c + onefuse.xyz_le[2]}')
+        out.append('End')
+
+    with open(filepath, "w") as f:
+        f.write('\n'.join(out))
+
+
+def _beam_lines(wing, beam_number, chordalfa_header, extra_column=None, t_offset=0):
+    """
+    Gives the lines of the ASWing "Beam" block of a lifting surface: its chord and twist distribution, followed by the
+    coordinates of its leading edge, both tabulated against the beamwise coordinate t.
+    :param wing: Wing object to describe.
+    :param beam_number: Index of this beam in the ASWing file (1-based) [int]
+    :param chordalfa_header: Column header line for the chord/twist table [string]
+    :param extra_column: Optional constant value to append to each row of the chord/twist table.
+    :param t_offset: Offset added to the beamwise coordinate t.
+    :return: A list of lines [list of strings]
+    """
+    table = np.array([
+        [xsec.xyz_le[0], xsec.xyz_le[1], xsec.xyz_le[2], xsec.chord, xsec.twist]
+        for xsec in wing.xsecs
+    ], dtype=float)  # Columns: x_le, y_le, z_le, chord, twist
+    xyz_le = table[:, :3]
+
+    '''
+    This part is hard to explain but basically I defined t (the beamwise axis)
+    as the axis that the beam changes most along. This can be generalized
+    but I'm not entirely sure how
+    '''
+    t_axis = int(np.argmax(np.abs(xyz_le[-1] - xyz_le[0])))
+    t = xyz_le[:, t_axis] + t_offset
+
+    chordalfa_columns = [t, table[:, 3], table[:, 4]]
+    if extra_column is not None:
+        chordalfa_columns.append(np.full_like(t, extra_column))
+
+    return [
+        '#============',
+        f'Beam {beam_number}',
+        wing.name,
+        chordalfa_header,
+        *_table_lines(np.stack(chordalfa_columns, axis=1)),
+        '#',
+        't    x    y    z',
+        *_table_lines(np.concatenate([t.reshape(-1, 1), xyz_le + wing.xyz_le], axis=1)),
+        'End',
+    ]
+
+
+def _table_lines(table):
+    """
+    Formats a 2D array of numbers as whitespace-separated rows of text, in the format ASWing expects.
+    :param table: 2D ndarray of numbers.
+    :return: A list of lines, one per row of the table [list of strings]
+    """
+    buffer = io.StringIO()
+    np.savetxt(buffer, table, fmt='%s', delimiter='    ')
+    return buffer.getvalue().splitlines()
@@ -0,0 +1,118 @@
+import aerosandbox.numpy as np
+from aerosandbox.library.aerodynamics.unsteady import *
+import pytest
+
+
+def duhamel_integral_loop(forcing, kernel):
+    """
+    Reference implementation of the discrete Duhamel superposition, as an explicit double loop.
+    """
+    lift = np.zeros(len(kernel))
+    for i in range(len(kernel)):
+        lift[i] = forcing[0] * kernel[i] + sum(
+            (forcing[j + 1] - forcing[j]) * kernel[i - j]
+            for j in range(i)
+        )
+    return lift
+
+
+def test_calculate_reduced_time():
+    time = np.linspace(0, 10, 11)
+
+    assert calculate_reduced_time(time, 2, 4) == pytest.approx(time)
+    assert calculate_reduced_time(time, np.float64(2), 4) == pytest.approx(time)
+    assert calculate_reduced_time(time, 2 * np.ones_like(time), 4) == pytest.approx(time)
+    assert calculate_reduced_time(time + 5, 2 * np.ones_like(time), 4) == pytest.approx(time)
+    assert calculate_reduced_time(time, time, 2)[-1] == pytest.approx(50)
+    assert calculate_reduced_time([0, 1, 2, 3], [1, 1, 2, 2], 2) == pytest.approx([0, 1, 2.5, 4.5])
+    assert calculate_reduced_time([1, 2, 3], [2, 2, 2], 4) == pytest.approx([0, 1, 2])
+    assert len(calculate_reduced_time(np.array([]), np.array([]), 2)) == 0
+
+
+@pytest.mark.parametrize("n", [100, 2500])
+def test_duhamel_integral_kussner(n):
+    reduced_time = calculate_reduced_time(np.linspace(0, 10, n), 2., 2)
+    gust_velocity = np.array([top_hat_gust(s) for s in reduced_time])
+
+    lift_coefficient = duhamel_integral_kussner(reduced_time, gust_velocity, 2.)
+
+    assert lift_coefficient == pytest.approx(
+        2 * np.pi / 2. * duhamel_integral_loop(gust_velocity, kussners_function(reduced_time))
+    )
+
+
+@pytest.mark.parametrize("n", [100, 2500])
+def test_duhamel_integral_wagner(n):
+    reduced_time = calculate_reduced_time(np.linspace(0, 10, n), 2., 2)
+    angle_of_attack = gaussian_pitch(reduced_time)
+
+    lift_coefficient = duhamel_integral_wagner(reduced_time, angle_of_attack)
+
+    assert lift_coefficient == pytest.approx(
+        2 * np.pi * duhamel_integral_loop(np.deg2rad(angle_of_attack), wagners_function(reduced_time))
+    )
+
+
+def test_duhamel_integral_precomputed_kernel():
+    reduced_time = np.linspace(0, 20, 200)
+    kussner = kussners_function(reduced_time)
+    wagner = wagners_function(reduced_time)
+
+    for gust_strength in [0.5, 1, 2]:
+        gust_velocity = gust_strength * np.array([top_hat_gust(s) for s in reduced_time])
+        assert duhamel_integral_kussner(reduced_time, gust_velocity, 2., _kussner=kussner) == pytest.approx(
+            duhamel_integral_kussner(reduced_time, gust_velocity, 2.)
+        )
+
+    angle_of_attack = gaussian_pitch(reduced_time)
+    assert duhamel_integral_wagner(reduced_time, angle_of_attack, _wagner=wagner) == pytest.approx(
+        duhamel_integral_wagner(reduced_time, angle_of_attack)
+    )
+
+
+def test_duhamel_integral_nonuniform_grid():
+    reduced_time = 20 * np.linspace(0, 1, 150) ** 2
+    gust_velocity = np.array([sine_squared_gust(s) for s in reduced_time])
+    angle_of_attack = gaussian_pitch(reduced_time)
+
+    def lift_loop(forcing, indicial_response):
+        return np.array([
+            forcing[0] * indicial_response(s_i) + sum(
+                (forcing[j + 1] - forcing[j]) * indicial_response(s_i - reduced_time[j])
+                for j in range(i)
+            )
+            for i, s_i in enumerate(reduced_time)
+        ])
+
+    assert duhamel_integral_kussner(reduced_time, gust_velocity, 2.) == pytest.approx(
+        2 * np.pi / 2. * lift_loop(gust_velocity, kussners_function)
+    )
+    assert duhamel_integral_wagner(reduced_time, angle_of_attack) == pytest.approx(
+        2 * np.pi * lift_loop(np.deg2rad(angle_of_attack), wagners_function)
+    )
+
+
+def test_duhamel_integral_step_gust_is_indicial_response():
+    reduced_time = np.linspace(0, 20, 200)
+
+    lift_coefficient = duhamel_integral_kussner(reduced_time, np.ones_like(reduced_time), 10.)
+
+    assert lift_coefficient == pytest.approx(2 * np.pi / 10. * kussners_function(reduced_time))
+
+
+@pytest.mark.parametrize("reduced_time", [
+    np.linspace(0, 20, 300),
+    20 * np.linspace(0, 1, 150) ** 2,
+])
+def test_make_kussner_duhamel(reduced_time):
+    duhamel = make_kussner_duhamel(reduced_time, 2.)
+
+    for gust_strength in [0.5, 1, 2]:
+        gust_velocity = gust_strength * np.array([sine_squared_gust(s) for s in reduced_time])
+        assert duhamel(gust_velocity) == pytest.approx(
+            duhamel_integral_kussner(reduced_time, gust_velocity, 2.)
+        )
+
+
+if __name__ == '__main__':
+    pytest.main()
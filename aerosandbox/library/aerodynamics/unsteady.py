@@ -2,6 +2,9 @@ import matplotlib.pyplot as plt
 import aerosandbox.numpy as np
 from typing import Union, Callable
 from scipy.integrate import quad
+from scipy.signal import convolve
+from scipy.fft import rfft, irfft, next_fast_len
+import math
 
 #         Welcome to the unsteady aerodynamics library!
 # In here you will find analytical, time-domain models for the
@@ -49,10 +52,10 @@ def main():
     plt.title("Gust and pitch example profiles")
     
     
-    total_lift = pitching_through_transverse_gust(reduced_time,top_hat_gust,wing_velocity,gaussian_pitch) 
     gust_lift = calculate_lift_due_to_transverse_gust(reduced_time,top_hat_gust,wing_velocity,gaussian_pitch)
     pitch_lift = calculate_lift_due_to_pitching_profile(reduced_time,gaussian_pitch)
     added_mass_lift = added_mass_due_to_pitching(reduced_time,gaussian_pitch)
+    total_lift = gust_lift + pitch_lift + added_mass_lift # Equal to pitching_through_transverse_gust(), without recomputing each source
 
     
     # Visualize the different sources of lift
@@ -91,13 +94,17 @@ def calculate_reduced_time(
     Returns:
         The reduced time as an ndarray or float similar to the input. The first element is 0. 
     """
-    if type(velocity) == float or type(velocity) == int : 
+    if np.isscalar(velocity): 
         return 2 * velocity * time / chord
     else:
+        time = np.asarray(time, dtype=float)
+        velocity = np.asarray(velocity)
         assert np.size(velocity) == np.size(time) , "The velocity history and time must have the same length"
-        reduced_time = np.zeros_like(time)
-        for i in range(len(time)-1):
-            reduced_time[i+1] =  reduced_time[i] + (velocity[i+1] + velocity[i])/2 * (time[i+1]-time[i])        
+        if velocity.size and np.all(velocity == velocity[0]): # Constant velocity, so the integral is exact without the cumulative sum
+            return 2 * velocity[0] / chord * (time - time[0])
+        reduced_time = np.empty_like(time, dtype=float)
+        reduced_time[:1] = 0 # (A slice, so that empty histories still work)
+        np.cumsum((velocity[1:] + velocity[:-1]) / 2 * np.diff(time), out=reduced_time[1:]) # Trapezoidal integration
         return 2 / chord * reduced_time
     
     
@@ -110,8 +117,16 @@ def wagners_function(reduced_time: Union[np.ndarray,float]):
     Args:
         reduced_time (float,np.ndarray) : Equal to the number of semichords travelled. See function calculate_reduced_time
     """
-    wagner = (1 - 0.165 * np.exp(-0.0455 * reduced_time) - 
-                0.335 * np.exp(-0.3 * reduced_time)) * np.where(reduced_time >= 0,1,0)
+    if np.isscalar(reduced_time): # Fast path for scalars (e.g. from inside quad integrands)
+        if reduced_time < 0:
+            return 0.
+        return 1 - 0.165 * math.exp(-0.0455 * reduced_time) - 0.335 * math.exp(-0.3 * reduced_time)
+
+    wagner = np.where(
+        reduced_time < 0,
+        0,
+        1 - 0.165 * np.exp(-0.0455 * reduced_time) - 0.335 * np.exp(-0.3 * reduced_time)
+    )
     return wagner
 
 
@@ -122,8 +137,16 @@ def kussners_function(reduced_time: Union[np.ndarray,float]):
     Args:
         reduced_time (float,np.ndarray) : This is equal to the number of semichords travelled. See function calculate_reduced_time
     """
-    kussner = (1 - 0.5 * np.exp(-0.13 * reduced_time) - 
-               0.5 * np.exp(-reduced_time)) * np.where(reduced_time>=0,1,0)
+    if np.isscalar(reduced_time): # Fast path for scalars (e.g. from inside quad integrands)
+        if reduced_time < 0:
+            return 0.
+        return 1 - 0.5 * math.exp(-0.13 * reduced_time) - 0.5 * math.exp(-reduced_time)
+
+    kussner = np.where(
+        reduced_time < 0,
+        0,
+        1 - 0.5 * np.exp(-0.13 * reduced_time) - 0.5 * np.exp(-reduced_time)
+    )
     return kussner 
 
 
@@ -218,7 +241,7 @@ def calculate_lift_due_to_transverse_gust(
                 gust_velocity_profile(s - sigma - offset) * 
                 np.cos(AoA_function(s - sigma)))
                 
-    lift_coefficient = np.zeros_like(reduced_time) 
+    lift_coefficient = np.empty_like(reduced_time) # Every entry is filled in below
     for i,s in enumerate(reduced_time): 
         I = quad(integrand, 0, s, args=(s,chord))[0]
         lift_coefficient[i] = 2 * np.pi *  I / plate_velocity
@@ -257,24 +280,200 @@ def calculate_lift_due_to_pitching_profile(
                 0.00750075 * np.exp(-0.0455 * reduced_time))
      
     def integrand(sigma,s):
-        if dW_ds(sigma) < 0:
-            dW_ds(sigma)
         return dW_ds(sigma) * AoA_function(s-sigma)
      
-    lift_coefficient = np.zeros_like(reduced_time)
+    lift_coefficient = np.empty_like(reduced_time) # Every entry is filled in below
+    wagner_0 = wagners_function(0)
 
     for i,s in enumerate(reduced_time):
         
         I = quad(integrand, 0, s, args=s)[0]    
         #print(I)                        
         lift_coefficient[i] = 2 * np.pi * (AoA_function(s) * 
-                                           wagners_function(0) + 
+                                           wagner_0 + 
                                            I)
     
     return lift_coefficient
 
 
 
+def _duhamel_superposition(
+        increments: np.ndarray,
+        kernel: np.ndarray
+        ) -> np.ndarray:
+    """
+    Computes the discrete Duhamel superposition sum_{j<i} increments[j] * kernel[i-j] for each i, as a convolution 
+    (by FFT or directly, whichever scipy.signal.convolve estimates to be faster for this length). 
+    If only a few increments are nonzero, they are superposed directly instead.
+    
+    Args:
+        increments (np.ndarray) : The change in the forcing over each step, of length n-1 
+        kernel (np.ndarray) : The indicial response at each reduced time, of length n
+    Returns:
+        superposition (np.ndarray) : The superposition sum at each reduced time, of length n. The first element is 0.
+    """
+    n = len(kernel)
+    nonzero = np.flatnonzero(increments)
+    if len(nonzero) < 20: # Sparse forcing (e.g. a top-hat gust): only superpose the steps where the forcing changes
+        superposition = np.zeros(n)
+        for j in nonzero:
+            superposition[j+1:] += increments[j] * kernel[1:n-j]
+    else: # Every entry is overwritten, so skip zero-filling
+        superposition = np.empty(n)
+        superposition[0] = 0
+        superposition[1:] = convolve(increments, kernel[1:], method='auto')[:n-1]
+    return superposition
+
+
+def _duhamel_superposition_nonuniform(
+        reduced_time: np.ndarray,
+        increments: np.ndarray,
+        indicial_response: Callable[[np.ndarray],np.ndarray]
+        ) -> np.ndarray:
+    """
+    Computes the discrete Duhamel superposition sum_{j<i} increments[j] * K(s[i] - s[j]) for each i, on an arbitrary 
+    (possibly non-uniform) grid of reduced times. On a non-uniform grid, K(s[i] - s[j]) is not a function of i - j alone, 
+    so the sum is not a convolution; it is instead computed as a lower-triangular matrix-vector product, over only 
+    the steps where the forcing changes. The matrix is built a block of rows at a time, so that memory use stays bounded 
+    for long histories.
+    
+    Args:
+        reduced_time (np.ndarray) : Reduced time, equal to the number of semichords travelled. See function reduced_time
+        increments (np.ndarray) : The change in the forcing over each step, of length n-1 
+        indicial_response (Callable[[np.ndarray],np.ndarray]) : The indicial response as a function of reduced time (e.g. wagners_function)
+    Returns:
+        superposition (np.ndarray) : The superposition sum at each reduced time, of length n. The first element is 0.
+    """
+    n = len(reduced_time)
+    nonzero = np.flatnonzero(increments) # Steps where the forcing doesn't change contribute nothing, so skip their columns
+    reduced_time_nonzero = reduced_time[nonzero].reshape(1, -1)
+    increments_nonzero = increments[nonzero]
+    
+    superposition = np.empty(n)
+    block_size = max(1, 2 ** 20 // max(len(nonzero), 1)) # Rows per block, so that each block has at most ~1M entries
+    for start in range(0, n, block_size):
+        rows = np.arange(start, min(start + block_size, n)).reshape(-1, 1)
+        kernel_block = np.where(
+            rows > nonzero.reshape(1, -1), # Only the increments strictly before each reduced time contribute
+            indicial_response(reduced_time[rows] - reduced_time_nonzero),
+            0
+        )
+        superposition[start:start + len(rows)] = kernel_block @ increments_nonzero
+    return superposition
+
+
+def _is_uniform(reduced_time: np.ndarray) -> bool:
+    """
+    Checks whether a grid of reduced times is uniformly spaced.
+    """
+    ds = np.diff(reduced_time)
+    return len(ds) == 0 or np.allclose(ds, ds[0])
+
+
+def duhamel_integral_kussner(
+        reduced_time: np.ndarray,
+        gust_velocity: np.ndarray,
+        velocity: float,
+        _kussner: np.ndarray = None
+        ) -> np.ndarray:
+    """
+    Calculates the duhamel superposition integral of Kussner's problem for a sampled gust history.
+    Given some arbitrary transverse velocity profile, the lift coefficient as a function of
+    reduced time of a flat plate can be computed using this function
+    
+    Args:
+        reduced_time (np.ndarray) : Reduced time, equal to the number of semichords travelled. See function reduced_time. Need not be uniformly spaced.
+        gust_velocity (np.ndarray) : The transverse velocity that the flat plate experiences at each reduced time
+        velocity (float) : The velocity by which the flat plate enters the gust
+        _kussner (np.ndarray) : Optionally, kussners_function(reduced_time - reduced_time[0]), if it has already been computed 
+            (e.g. when sweeping many gust profiles over the same grid)
+    Returns:
+        lift_coefficient (np.ndarray) : The lift coefficient history of the flat plate 
+    """
+    assert np.size(reduced_time) == np.size(gust_velocity), "The gust velocity history and reduced time must have the same length"
+    
+    if _kussner is None:
+        kussner = kussners_function(reduced_time - reduced_time[0])
+    else:
+        kussner = _kussner
+    if _is_uniform(reduced_time):
+        integral_term = _duhamel_superposition(np.diff(gust_velocity), kussner)
+    else:
+        integral_term = _duhamel_superposition_nonuniform(reduced_time, np.diff(gust_velocity), kussners_function)
+    
+    return 2 * np.pi / velocity * (gust_velocity[0] * kussner + integral_term)
+
+
+def duhamel_integral_wagner(
+        reduced_time: np.ndarray,
+        angle_of_attack: np.ndarray, # In degrees
+        _wagner: np.ndarray = None
+        ) -> np.ndarray:
+    """
+    Calculates the duhamel superposition integral of Wagner's problem for a sampled pitching history.
+    Given some arbitrary pitching profile, the lift coefficient as a function of reduced time
+    of a flat plate can be computed using this function
+    
+    Args:
+        reduced_time (np.ndarray) : Reduced time, equal to the number of semichords travelled. See function reduced_time. Need not be uniformly spaced.
+        angle_of_attack (np.ndarray) : The angle of attack of the flat plate at each reduced time, in degrees
+        _wagner (np.ndarray) : Optionally, wagners_function(reduced_time - reduced_time[0]), if it has already been computed 
+            (e.g. when sweeping many pitching profiles over the same grid)
+    Returns:
+        lift_coefficient (np.ndarray) : The lift coefficient history of the flat plate 
+    """
+    assert np.size(reduced_time) == np.size(angle_of_attack), "The angle of attack history and reduced time must have the same length"
+    
+    angle_of_attack_radians = np.deg2rad(angle_of_attack)
+    if _wagner is None:
+        wagner = wagners_function(reduced_time - reduced_time[0])
+    else:
+        wagner = _wagner
+    if _is_uniform(reduced_time):
+        integral_term = _duhamel_superposition(np.diff(angle_of_attack_radians), wagner)
+    else:
+        integral_term = _duhamel_superposition_nonuniform(reduced_time, np.diff(angle_of_attack_radians), wagners_function)
+    
+    return 2 * np.pi * (angle_of_attack_radians[0] * wagner + integral_term)
+
+
+def make_kussner_duhamel(
+        reduced_time: np.ndarray,
+        velocity: float
+        ) -> Callable[[np.ndarray],np.ndarray]:
+    """
+    Specializes duhamel_integral_kussner to a fixed grid of reduced times, for when many gust histories are swept 
+    over the same grid. Kussner's function, and (on a uniform grid) its Fourier transform, are computed once here 
+    rather than on every call.
+    
+    Args:
+        reduced_time (np.ndarray) : Reduced time, equal to the number of semichords travelled. See function reduced_time. Need not be uniformly spaced.
+        velocity (float) : The velocity by which the flat plate enters the gust
+    Returns:
+        duhamel (Callable[[np.ndarray],np.ndarray]) : A function that takes the gust velocity at each reduced time and 
+            returns the lift coefficient history, identical to duhamel_integral_kussner(reduced_time, gust_velocity, velocity)
+    """
+    n = len(reduced_time)
+    kussner = kussners_function(reduced_time - reduced_time[0])
+
+    if n < 2 or not _is_uniform(reduced_time):
+        def duhamel(gust_velocity: np.ndarray) -> np.ndarray:
+            return duhamel_integral_kussner(reduced_time, gust_velocity, velocity, _kussner=kussner)
+        return duhamel
+
+    n_fft = next_fast_len(2 * n - 2) # Long enough that the circular convolution doesn't wrap around
+    kussner_fft = rfft(kussner[1:], n_fft)
+
+    def duhamel(gust_velocity: np.ndarray) -> np.ndarray:
+        assert np.size(gust_velocity) == n, "The gust velocity history and reduced time must have the same length"
+        integral_term = np.empty(n)
+        integral_term[0] = 0
+        integral_term[1:] = irfft(rfft(np.diff(gust_velocity), n_fft) * kussner_fft, n_fft)[:n-1]
+        return 2 * np.pi / velocity * (gust_velocity[0] * kussner + integral_term)
+
+    return duhamel
+
+
 def added_mass_due_to_pitching(
         reduced_time: np.ndarray,
         angle_of_attack: Callable[[float],float] # In degrees
@@ -291,12 +490,17 @@ def added_mass_due_to_pitching(
         lift_coefficient (np.ndarray) : The lift coefficient history of the flat plate 
     """
 
-    AoA = np.array([np.deg2rad(angle_of_attack(s)) for s in reduced_time])
+    AoA = np.deg2rad(np.array([angle_of_attack(s) for s in reduced_time], dtype=float))
     da_ds = np.gradient(AoA,reduced_time) 
     
     # TODO: generalize to all unsteady motion
     
-    return np.pi / 2 * np.cos(AoA)**2 * da_ds
+    # pi / 2 * cos(AoA)^2 * da_ds, computed in place to avoid a temporary array per operation
+    lift_coefficient = np.cos(AoA)
+    lift_coefficient *= lift_coefficient
+    lift_coefficient *= da_ds
+    lift_coefficient *= np.pi / 2
+    return lift_coefficient
     
     
 
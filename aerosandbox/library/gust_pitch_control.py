@@ -34,27 +34,21 @@ class TransverseGustPitchControl(ImplicitAnalysis):
          
      def _setup_unknowns(self):
         self.angles_of_attack = self.opti.variable(init_guess=1,n_vars=self.timesteps)
-        self.lift_coefficients = self.opti.variable(init_guess=1,n_vars=self.timesteps-1)
     
      def _enforce_governing_equations(self):
-        # Calculate unsteady lift due to pitching 
-        wagner = wagners_function(self.reduced_time)
+        # Calculate unsteady lift due to pitching, with the same discretization as duhamel_integral_wagner (on any grid),
+        # so that calculate_transients() agrees
+        s = self.reduced_time[:-1]
         ds = self.reduced_time[1:] - self.reduced_time[:-1]
         da_ds = (self.angles_of_attack[1:] - self.angles_of_attack[:-1])/ds
-        init_term = self.angles_of_attack[0]*wagner[:-1]
-        for i in range(self.timesteps-1):
-            integral_term = np.sum(da_ds[j] * wagner[i-j] * ds[j]  for j in range(i))
-            self.lift_coefficients[i] = 2*np.pi* (integral_term + init_term[i])
+        init_term = self.angles_of_attack[0]*wagners_function(s - s[0])
+        i, j = np.indices((self.timesteps-1, self.timesteps-1))
+        wagner_matrix = np.where(j < i, wagners_function(s[i] - s[j]), 0) # integral_term[i] = sum(da_ds[j] * W(s[i] - s[j]) * ds[j] for j < i)
+        integral_term = wagner_matrix @ (da_ds * ds)
+        self.lift_coefficients = 2*np.pi* (integral_term + init_term)
             
-        # Calculate unsteady lift due to transverse gust 
-        kussner = kussners_function(self.reduced_time)
-        dw_ds = (self.gust_profile[1:] - self.gust_profile[:-1])/ds
-        init_term = self.gust_profile[0]*kussner
-        for i in range(self.timesteps-1):
-            integral_term = 0
-            for j in range(i):
-                integral_term += dw_ds[j] * kussner[i-j] * ds[j]
-            self.lift_coefficients[i] += 2*np.pi/self.velocity*(init_term[i] + integral_term)
+        # Calculate unsteady lift due to transverse gust (independent of the unknowns)
+        self.lift_coefficients += duhamel_integral_kussner(self.reduced_time,self.gust_profile,self.velocity)[:-1]
         
         # Calculate unsteady lift due to added mass
         self.lift_coefficients += np.pi / 2 * np.cos(self.angles_of_attack[:-1])**2 * da_ds
@@ -71,28 +65,15 @@ class TransverseGustPitchControl(ImplicitAnalysis):
         self.optimal_pitching_profile_deg = np.rad2deg(self.optimal_pitching_profile_rad)
         self.optimal_lift_history = self.opti.value(self.lift_coefficients)
         
-        self.pitching_lift = np.zeros(self.timesteps-1)
         # Calculate unsteady lift due to pitching 
-        wagner = wagners_function(self.reduced_time)
-        ds = self.reduced_time[1:] - self.reduced_time[:-1]
-        da_ds = (self.optimal_pitching_profile_rad[1:] - self.optimal_pitching_profile_rad[:-1])/ds
-        init_term = self.optimal_pitching_profile_rad[0]*wagner[:-1]
-        for i in range(self.timesteps-1):
-            integral_term = np.sum(da_ds[j] * wagner[i-j] * ds[j]  for j in range(i))
-            self.pitching_lift[i] = 2*np.pi* (integral_term + init_term[i])
+        self.pitching_lift = duhamel_integral_wagner(self.reduced_time,self.optimal_pitching_profile_deg)[:-1]
             
-        self.gust_lift = np.zeros(self.timesteps-1)
         # Calculate unsteady lift due to transverse gust 
-        kussner = kussners_function(self.reduced_time)
-        dw_ds = (self.gust_profile[1:] - self.gust_profile[:-1])/ds
-        init_term = self.gust_profile[0]*kussner
-        for i in range(self.timesteps-1):
-            integral_term = 0
-            for j in range(i):
-                integral_term += dw_ds[j] * kussner[i-j] * ds[j]
-            self.gust_lift[i] += 2*np.pi/self.velocity*(init_term[i] + integral_term)
+        self.gust_lift = duhamel_integral_kussner(self.reduced_time,self.gust_profile,self.velocity)[:-1]
             
         # Calculate unsteady lift due to added mass
+        ds = self.reduced_time[1:] - self.reduced_time[:-1]
+        da_ds = (self.optimal_pitching_profile_rad[1:] - self.optimal_pitching_profile_rad[:-1])/ds
         self.added_mass_lift = np.pi / 2 * np.cos(self.optimal_pitching_profile_rad[:-1])**2 * da_ds
         
 
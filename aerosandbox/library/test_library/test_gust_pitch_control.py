@@ -0,0 +1,31 @@
+import aerosandbox.numpy as np
+from aerosandbox.library.gust_pitch_control import *
+import pytest
+
+
+def check_lift_components_sum_to_total(reduced_time):
+    gust_profile = np.array([top_hat_gust(s) for s in reduced_time])
+
+    optimal = TransverseGustPitchControl(reduced_time, gust_profile, 2)
+    optimal.calculate_transients()
+
+    assert optimal.optimal_lift_history == pytest.approx(
+        optimal.pitching_lift + optimal.gust_lift + optimal.added_mass_lift,
+        abs=1e-6
+    )
+
+
+def test_lift_components_sum_to_total():
+    check_lift_components_sum_to_total(np.linspace(0, 20, 60))
+
+
+def test_lift_components_sum_to_total_offset_grid():
+    check_lift_components_sum_to_total(np.linspace(2, 22, 60))
+
+
+def test_lift_components_sum_to_total_nonuniform_grid():
+    check_lift_components_sum_to_total(20 * np.linspace(0, 1, 60) ** 2)
+
+
+if __name__ == '__main__':
+    pytest.main()
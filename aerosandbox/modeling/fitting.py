@@ -1,8 +1,8 @@
 import aerosandbox.numpy as np
+import casadi as cas
 from aerosandbox.optimization.opti import Opti
 from typing import Union, Dict, Callable, List
 from aerosandbox.modeling.surrogate_model import SurrogateModel
-import copy
 import warnings
 
 
@@ -50,6 +50,7 @@ class FittedModel(SurrogateModel):
                  weights: np.ndarray = None,
                  put_residuals_in_logspace: bool = False,
                  verbose=True,
+                 use_smooth_norm: bool = False,
                  ):
         """
         Fits an analytical model to n-dimensional unstructured data using an automatic-differentiable optimization approach.
@@ -87,6 +88,11 @@ class FittedModel(SurrogateModel):
 
             y_data: Values of the independent variable in the dataset to be fitted. [1D ndarray of length n]
 
+                * x_data and y_data are not copied if they are already contiguous arrays: FittedModel.x_data and
+                FittedModel.y_data are then read-only views of the arrays that you passed in. So, if you modify those
+                arrays after fitting, the data stored on the FittedModel changes too. Pass in copies if you plan to do
+                this.
+
             parameter_guesses: a dict of fit parameters. Syntax is {param_name:param_initial_guess}.
 
                 * Parameters will be initialized to the values set here; all parameters need an initial guess.
@@ -131,6 +137,18 @@ class FittedModel(SurrogateModel):
             verbose: Should the progress of the optimization solve that is part of the fitting be displayed? See
             `aerosandbox.Opti.solve(verbose=)` syntax for more details.
 
+            use_smooth_norm: Only applies if residual_norm_type is "L1" or "Linf". If True, minimizes a smooth
+            approximation of the norm directly, rather than the exact reformulation (which adds an auxiliary
+            variable and two constraints per data point for L1, or two constraints per data point for Linf):
+
+                * "L1" is approximated as sum(sqrt(error ** 2 + eps ** 2)), where eps is tiny relative to the spread
+                of the data.
+
+                * "Linf" is approximated with a log-sum-exp (soft maximum) of the errors, with a sharpness that is
+                scaled to the spread of the data.
+
+                This makes the fit much cheaper for large datasets, at the cost of a slightly approximate optimum.
+
         Returns: A model in the form of a FittedModel object. Some things you can do:
             >>> y = FittedModel(x) # evaluate the FittedModel at new x points
             >>> FittedModel.parameters # directly examine the optimal values of the parameters that were found
@@ -144,7 +162,12 @@ class FittedModel(SurrogateModel):
 
         ### Flatten all inputs
         def flatten(input):
-            return np.array(input).flatten()
+            # Only copies if the input is not already a contiguous array. Since the result may then share memory with
+            # the user's array, return a read-only view of it, so that nothing downstream (e.g., a model that does
+            # in-place operations on x) can modify the user's data.
+            view = np.ravel(np.asarray(input)).view()
+            view.flags.writeable = False
+            return view
 
         try:
             x_data = {
@@ -156,31 +179,31 @@ class FittedModel(SurrogateModel):
             x_data = flatten(x_data)
             x_data_is_dict = False
         y_data = flatten(y_data)
-        n_datapoints = np.length(y_data)
+        n_datapoints = y_data.size
 
         ### Handle weighting
         if weights is None:
-            weights = np.ones(n_datapoints)
+            weights = np.full(n_datapoints, 1 / n_datapoints)  # Uniform weights, already normalized to sum to 1.
         else:
             weights = flatten(weights)
-        sum_weights = np.sum(weights)
-        if sum_weights <= 0:
-            raise ValueError("The weights must sum to a positive number!")
-        if np.any(weights < 0):
-            raise ValueError("No entries of the weights vector are allowed to be negative!")
-        weights = weights / np.sum(weights)  # Normalize weights so that they sum to 1.
+            sum_weights = weights.sum()
+            if sum_weights <= 0:
+                raise ValueError("The weights must sum to a positive number!")
+            if np.any(weights < 0):
+                raise ValueError("No entries of the weights vector are allowed to be negative!")
+            weights = weights / sum_weights  # Normalize weights so that they sum to 1. Not in-place, as `weights` may be the user's array.
 
         ### Check format of parameter_bounds input
         if parameter_bounds is None:
             parameter_bounds = {}
-        for param_name, v in parameter_bounds.items():
-            if param_name not in parameter_guesses.keys():
-                raise ValueError(
-                    f"A parameter name (key = \"{param_name}\") in parameter_bounds was not found in parameter_guesses.")
-            if not np.length(v) == 2:
-                raise ValueError(
-                    "Every value in parameter_bounds must be a tuple in the format (lower_bound, upper_bound). "
-                    "For one-sided bounds, use None for the unbounded side.")
+        unknown_param_names = parameter_bounds.keys() - parameter_guesses.keys()
+        if unknown_param_names:
+            raise ValueError(
+                f"Parameter names (keys = {sorted(unknown_param_names, key=str)}) in parameter_bounds were not found in parameter_guesses.")
+        if not all(np.length(v) == 2 for v in parameter_bounds.values()):
+            raise ValueError(
+                "Every value in parameter_bounds must be a tuple in the format (lower_bound, upper_bound). "
+                "For one-sided bounds, use None for the unbounded side.")
 
         ### If putting residuals in logspace, check positivity
         if put_residuals_in_logspace:
@@ -199,7 +222,7 @@ class FittedModel(SurrogateModel):
 
         for key, value in relevant_inputs.items():
             # Check that the length of the inputs are consistent
-            series_length = np.length(value)
+            series_length = value.size
             if not series_length == n_datapoints:
                 raise ValueError(
                     f"The supplied data series \"{key}\" has length {series_length}, but y_data has length {n_datapoints}.")
@@ -224,12 +247,11 @@ class FittedModel(SurrogateModel):
                 )
 
         ### Evaluate the model at the data points you're trying to fit
-        x_data_original = copy.deepcopy(
-            x_data)  # Make a copy of x_data so that you can determine if the model did in-place operations on x and tattle on the user.
-
         try:
             y_model = model(x_data, params)  # Evaluate the model
-        except Exception:
+        except Exception as e:
+            if isinstance(e, ValueError) and "read-only" in str(e):  # x_data is read-only, so in-place operations fail
+                raise TypeError("model(x_data, parameter_guesses) did in-place operations on x, which is not allowed!")
             raise Exception("""
             There was an error when evaluating the model you supplied with the x_data you supplied.
             Likely possible causes:
@@ -239,15 +261,6 @@ class FittedModel(SurrogateModel):
             See the docstring of FittedModel() if you have other usage questions or would like to see examples.
             """)
 
-        try:  ### If the model did in-place operations on x_data, throw an error
-            x_data_is_unchanged = np.all(x_data == x_data_original)
-        except ValueError:
-            x_data_is_unchanged = np.all([
-                x_series == x_series_original
-                for x_series, x_series_original in zip(x_data, x_data_original)
-            ])
-        if not x_data_is_unchanged:
-            raise TypeError("model(x_data, parameter_guesses) did in-place operations on x, which is not allowed!")
         if y_model is None:  # Make sure that y_model actually returned something sensible
             raise TypeError("model(x_data, parameter_guesses) returned None, when it should've returned a 1D ndarray.")
 
@@ -255,29 +268,52 @@ class FittedModel(SurrogateModel):
         if not put_residuals_in_logspace:
             error = y_model - y_data
         else:
+            log_y_data = np.log(y_data)  # A constant, so take its log once, in NumPy.
             y_model = np.fmax(y_model, 1e-300)  # Keep y_model very slightly always positive, so that log() doesn't NaN.
-            error = np.log(y_model) - np.log(y_data)
+            error = np.log(y_model) - log_y_data
+
+        ### The typical magnitude of the error, used to scale the smooth norm approximations. This is the largest error
+        # of the best constant fit, so it measures the spread of the data rather than its magnitude (which may be dominated
+        # by an offset).
+        y_target = log_y_data if put_residuals_in_logspace else y_data
+        error_scale = np.max(np.abs(y_target - np.mean(y_target)))
+        if error_scale == 0:
+            error_scale = 1
 
         ### Set up the optimization problem to minimize some norm(error), which looks different depending on the norm used:
         if residual_norm_type.lower() == "l1":  # Minimize the L1 norm
-            abs_error = opti.variable(init_guess=0,
-                                      n_vars=np.length(y_data))  # Make the abs() of each error entry an opt. var.
-            opti.subject_to([
-                abs_error >= error,
-                abs_error >= -error,
-            ])
-            opti.minimize(np.sum(weights * abs_error))
+            if use_smooth_norm:  # Smooth approximation of abs(error), so that no auxiliary variables are needed
+                smooth_l1_norm = np.sum(weights * (error ** 2 + (1e-6 * error_scale) ** 2) ** 0.5)
+                opti.minimize(smooth_l1_norm ** 2)  # Squared, as the norm alone has almost no curvature far from the optimum
+            else:
+                abs_error = opti.variable(init_guess=0,
+                                          n_vars=n_datapoints)  # Make the abs() of each error entry an opt. var.
+                opti.subject_to([
+                    abs_error >= error,
+                    abs_error >= -error,
+                ])
+                opti.minimize(np.sum(weights * abs_error))
 
         elif residual_norm_type.lower() == "l2":  # Minimize the L2 norm
             opti.minimize(np.sum(weights * error ** 2))
 
         elif residual_norm_type.lower() == "linf":  # Minimize the L-infinity norm
-            linf_value = opti.variable(init_guess=0)  # Make the value of the L-infinity norm an optimization variable
-            opti.subject_to([
-                linf_value >= weights * error,
-                linf_value >= -weights * error
-            ])
-            opti.minimize(linf_value)
+            if use_smooth_norm:  # Log-sum-exp (soft maximum) of the weighted errors, in both directions
+                hardness = 1000 / (error_scale * np.max(weights))
+                scaled_error = hardness * weights * error
+                shift = np.max(np.fabs(scaled_error))  # Shift the exponents so that they can't overflow
+                smooth_linf_norm = (shift + np.log(np.sum(
+                    np.exp(scaled_error - shift) +
+                    np.exp(-scaled_error - shift)
+                ))) / hardness
+                opti.minimize(smooth_linf_norm ** 2)  # Squared, as the norm alone has almost no curvature far from the optimum
+            else:
+                linf_value = opti.variable(init_guess=0)  # Make the value of the L-infinity norm an optimization variable
+                opti.subject_to([
+                    linf_value >= weights * error,
+                    linf_value >= -weights * error
+                ])
+                opti.minimize(linf_value)
 
         else:
             raise ValueError("Bad input for the 'residual_type' parameter.")
@@ -298,12 +334,24 @@ class FittedModel(SurrogateModel):
         ##### Construct a FittedModel
 
         ### Create a vector of solved parameters
-        params_solved = {}
-        for param_name in params:
-            try:
-                params_solved[param_name] = sol.value(params[param_name])
-            except:
-                params_solved[param_name] = np.NaN
+        try:  # Extract all parameters in one call, rather than one call per parameter
+            values = np.ravel(sol.value(cas.vertcat(*params.values())))  # Only works if all parameters are column vectors
+            params_solved = {}
+            offset = 0
+            for param_name, param in params.items():  # Split the stacked values back up by each parameter's size
+                n_elements = param.numel()
+                if param.shape == (1, 1):
+                    params_solved[param_name] = float(values[offset])
+                else:
+                    params_solved[param_name] = values[offset:offset + n_elements]
+                offset += n_elements
+        except:
+            params_solved = {}
+            for param_name in params:
+                try:
+                    params_solved[param_name] = sol.value(params[param_name])
+                except:
+                    params_solved[param_name] = np.NaN
 
         ### Store all the data and inputs
         self.model = model
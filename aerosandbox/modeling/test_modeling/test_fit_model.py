@@ -229,5 +229,50 @@ def test_type_errors():
     with pytest.raises(TypeError):
         fitted_model(5)
 
+
+def test_in_place_model_does_not_modify_data():
+    x_data = np.linspace(0, 10, 50)
+    y_data = 2 * x_data + 1
+
+    def model(x, p):
+        x *= 2
+        return p["m"] * x + p["b"]
+
+    with pytest.raises(TypeError):
+        FittedModel(
+            model=model,
+            x_data=x_data,
+            y_data=y_data,
+            parameter_guesses={
+                "m": 0,
+                "b": 0,
+            },
+        )
+
+    assert x_data == pytest.approx(np.linspace(0, 10, 50))
+
+
+def test_vector_valued_parameter():
+    x = np.linspace(0, 10, 50)
+    y = 0.5 + 2 * x + 3 * x ** 2 + 4 * np.sin(x)
+
+    def model(x, p):
+        return p["c"][0] + p["c"][1] * x + p["c"][2] * x ** 2 + p["d"] * np.sin(x)
+
+    fitted_model = FittedModel(
+        model=model,
+        x_data=x,
+        y_data=y,
+        parameter_guesses={
+            "c": np.zeros(3),
+            "d": 0.5,
+        },
+    )
+
+    assert fitted_model.parameters["c"] == pytest.approx([0.5, 2, 3], abs=1e-6)
+    assert fitted_model.parameters["d"] == pytest.approx(4, abs=1e-6)
+    assert fitted_model(x) == pytest.approx(y, abs=1e-5)
+
+
 if __name__ == '__main__':
     pytest.main()
@@ -49,5 +49,39 @@ def test_fit_model_norm_type(plot=False):
         plt.show()
 
 
+@pytest.mark.parametrize("offset", [0, 1000])
+def test_fit_model_smooth_norm_type(offset):
+    y_data = measured_temperature + offset  # An offset shouldn't affect the fit, other than shifting the intercept
+
+    def model(x, p):
+        return p["1"] * x + p["0"]
+
+    def fit_model_with_norm(residual_norm_type, use_smooth_norm):
+        return FittedModel(
+            model=model,
+            x_data=time,
+            y_data=y_data,
+            parameter_guesses={
+                "1": 0,
+                "0": 0,
+            },
+            residual_norm_type=residual_norm_type,
+            use_smooth_norm=use_smooth_norm,
+        )
+
+    def max_error(fitted_model):
+        return np.max(np.abs(fitted_model(time) - y_data))
+
+    L1_model = fit_model_with_norm("L1", use_smooth_norm=False)
+    L1_smooth_model = fit_model_with_norm("L1", use_smooth_norm=True)
+    assert L1_smooth_model.parameters["1"] == pytest.approx(L1_model.parameters["1"], rel=1e-3)
+    assert L1_smooth_model.parameters["0"] == pytest.approx(L1_model.parameters["0"], rel=1e-3)
+
+    LInf_model = fit_model_with_norm("LInf", use_smooth_norm=False)
+    LInf_smooth_model = fit_model_with_norm("LInf", use_smooth_norm=True)
+    assert LInf_smooth_model.parameters["1"] == pytest.approx(LInf_model.parameters["1"], rel=0.01)
+    assert max_error(LInf_smooth_model) == pytest.approx(max_error(LInf_model), rel=0.01)
+
+
 if __name__ == '__main__':
     test_fit_model_norm_type(plot=True)
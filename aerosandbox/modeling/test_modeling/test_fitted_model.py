@@ -26,5 +26,30 @@ def test_plot(get_fitted_model):
     get_fitted_model.plot()
 
 
+def test_data_is_stored_as_read_only_views():
+    x_data = np.array(time, dtype=float)
+    y_data = np.array(measured_temperature, dtype=float)
+
+    fitted_model = FittedModel(
+        model=lambda x, p: p["m"] * x + p["b"],
+        x_data=x_data,
+        y_data=y_data,
+        parameter_guesses={
+            "m": 0,
+            "b": 0,
+        },
+    )
+
+    assert np.shares_memory(fitted_model.x_data, x_data)
+    assert np.shares_memory(fitted_model.y_data, y_data)
+    assert not fitted_model.x_data.flags.writeable
+    assert not fitted_model.y_data.flags.writeable
+    assert x_data.flags.writeable  # The user's own arrays should be left alone
+    assert y_data.flags.writeable
+
+    x_data[0] = -1  # The stored data is a view, not a snapshot, so it follows changes to the user's arrays
+    assert fitted_model.x_data[0] == -1
+
+
 if __name__ == '__main__':
     pytest.main()
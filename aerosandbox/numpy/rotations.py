@@ -1,5 +1,6 @@
 from aerosandbox.numpy import linalg
 from aerosandbox.numpy.array import array
+from aerosandbox.numpy.determine_type import is_casadi_type
 import numpy as _onp
 
 
@@ -31,19 +32,22 @@ def rotation_matrix_3D(
     """
     Gives the 3D rotation matrix from an angle and an axis.
     An implmentation of https://en.wikipedia.org/wiki/Rotation_matrix#Rotation_matrix_from_axis_and_angle
-    :param angle: can be one angle or a vector (1d ndarray) of angles. Given in radians. # TODO note deprecated functionality; must be scalar
-        Direction corresponds to the right-hand rule.
+    :param angle: can be one angle or a vector (1d ndarray) of angles. Given in radians.
+        Direction corresponds to the right-hand rule. A vector of angles must be numeric (not a CasADi type).
     :param axis: a 1d numpy array of length 3 (x,y,z). Represents the angle.
     :param _axis_already_normalized: boolean, skips normalization for speed if you flag this true.
     :return:
         * If angle is a scalar, returns a 3x3 rotation matrix.
-        * If angle is a vector, returns a 3x3xN rotation matrix.
+        * If angle is a vector of length N, returns an Nx3x3 stack of rotation matrices, one per angle.
     """
     if not _axis_already_normalized:
         axis = axis / linalg.norm(axis)
 
     sintheta = _onp.sin(angle)
     costheta = _onp.cos(angle)
+    if not is_casadi_type(angle) and _onp.ndim(angle) > 0:  # Vectorized over angles; broadcast to a stack of matrices.
+        sintheta = _onp.reshape(sintheta, (-1, 1, 1))
+        costheta = _onp.reshape(costheta, (-1, 1, 1))
     cpm = array([
         [0, -axis[2], axis[1]],
         [axis[2], 0, -axis[0]],
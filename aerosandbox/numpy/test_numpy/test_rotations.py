@@ -0,0 +1,24 @@
+import aerosandbox.numpy as np
+import pytest
+
+
+def test_rotation_matrix_3D_vectorized():
+    angles = np.linspace(0, 2 * np.pi, 7)
+    axis = np.array([1, 2, 3])
+
+    rots = np.rotation_matrix_3D(angles, axis)
+
+    assert rots.shape == (7, 3, 3)
+    for angle, rot in zip(angles, rots):
+        assert rot == pytest.approx(np.rotation_matrix_3D(angle, axis))
+
+
+def test_rotation_matrix_3D_vectorized_is_orthonormal():
+    rots = np.rotation_matrix_3D(np.linspace(0, 1, 5), np.array([0, 0, 1]))
+
+    for rot in rots:
+        assert rot @ rot.T == pytest.approx(np.eye(3))
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+import pytest
+
+
+def run_in_fresh_interpreter(code):
+    """
+    Runs some code in a fresh Python interpreter, since lazy imports depend on what's already been imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("name", [
+    "Airplane",
+    "Atmosphere",
+    "OperatingPoint",
+    "FittedModel",
+    "VortexLatticeMethod",
+    "performance",
+    "visualization",
+])
+def test_lazy_attribute(name):
+    run_in_fresh_interpreter(
+        f"import aerosandbox as asb; asb.{name}; asb.Airplane; asb.OperatingPoint; assert not hasattr(asb, 'nope')"
+    )
+
+
+def test_lazy_subpackage_import():
+    run_in_fresh_interpreter(
+        "import aerosandbox.performance; import aerosandbox as asb; asb.Airplane"
+    )
+
+
+def test_star_import():
+    run_in_fresh_interpreter(
+        "from aerosandbox import *; Airplane; OperatingPoint; FittedModel"
+    )
+
+
+def test_import_does_not_load_plotting():
+    run_in_fresh_interpreter(
+        "import sys, aerosandbox; assert 'plotly' not in sys.modules and 'matplotlib.pyplot' not in sys.modules"
+    )
+
+
+if __name__ == '__main__':
+    pytest.main()
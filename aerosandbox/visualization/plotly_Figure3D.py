@@ -19,30 +19,73 @@ def reflect_over_XZ_plane(input_vector):
         raise ValueError("The function expected either a 3-element vector or a Nx3 array!")
 
 
+def grid_to_quads(points, periodic=False):
+    """
+    Splits a structured grid of points into its quadrilateral faces.
+    :param points: an array of shape (M, N, 3), where points[i, j] is the 3D point at row i, column j of the grid.
+    :param periodic: Should the last column also be connected back to the first one (e.g. to close a ring)? [boolean]
+    :return: an array of shape (K, 4, 3) of quads, as accepted by Figure3D.add_quads(). Each quad is the sequence of points
+        (i, j), (i, j + 1), (i + 1, j + 1), (i + 1, j), in row-major order of (i, j).
+    """
+    points = np.array(points, dtype=float)
+    if periodic:
+        points = np.concatenate([points, points[:, :1, :]], axis=1)
+
+    return np.stack([
+        points[:-1, :-1],
+        points[:-1, 1:],
+        points[1:, 1:],
+        points[1:, :-1],
+    ], axis=2).reshape(-1, 4, 3)
+
+
+def circular_rings(centers, radii, n_points):
+    """
+    Builds a stack of circles in planes of constant x (e.g. the cross sections of a fuselage), as a structured grid.
+    :param centers: an array of shape (M, 3) of the center of each circle.
+    :param radii: an iterable of length M of the radius of each circle.
+    :param n_points: The number of points around each circle.
+    :return: an array of shape (M, n_points, 3), where points[i, j] is the j-th point around the i-th circle. Points
+        go around each circle in a right-handed sense about the x-axis, starting from +z. This can be passed to
+        grid_to_quads(points, periodic=True).
+    """
+    theta = 2 * np.pi * np.arange(n_points) / n_points
+    unit_circle = np.stack([
+        np.zeros_like(theta),
+        -np.sin(theta),
+        np.cos(theta),
+    ], axis=1)  # Shape: (n_points, 3)
+
+    return (
+            np.array(radii, dtype=float).reshape(-1, 1, 1) * unit_circle +
+            np.array(centers, dtype=float).reshape(-1, 1, 3)
+    )
+
+
 class Figure3D:
     def __init__(self):
         self.fig = go.Figure()
 
-        # Vertices of the faces
-        self.x_face = []
-        self.y_face = []
-        self.z_face = []
+        # Faces are accumulated as a list of arrays, and only concatenated once, at draw time.
+        self.face_vertices = []  # Each item is an (N, 3) array of vertices
+        self.face_triangles = []  # Each item is an (M, 3) array of (global) vertex indices, one row per triangle
+        self.face_intensities = []  # Each item is an (N,) array of the intensity at each vertex
+        self.n_face_vertices = 0
 
-        # Connectivity and color of the faces
-        self.i_face = []
-        self.j_face = []
-        self.k_face = []
-        self.intensity_face = []
+        # Lines and streamlines are accumulated as a list of (N, 3) arrays, where a row of NaNs breaks the line.
+        self.lines = []
+        self.streamlines = []
 
-        # Vertices of the lines
-        self.x_line = []
-        self.y_line = []
-        self.z_line = []
-
-        # Vertices of the streamlines
-        self.x_streamline = []
-        self.y_streamline = []
-        self.z_streamline = []
+    @staticmethod
+    def _as_polyline(points):
+        """
+        Converts an iterable of 3D points into an (N + 1, 3) array, with a trailing row of NaNs to break the line.
+        """
+        points = np.array(points, dtype=float).reshape(-1, 3)
+        return np.concatenate([
+            points,
+            np.full((1, 3), np.nan)
+        ], axis=0)
 
     def add_line(self,
                  points,
@@ -50,25 +93,16 @@ class Figure3D:
                  ):
         """
         Adds a line (or series of lines) to draw.
-        :param points: an iterable with an arbitrary number of items. Each item is a 3D point, represented as an iterable of length 3.
+        :param points: an iterable with an arbitrary number of items. Each item is a 3D point, represented as an iterable of length 3. Can also be an (N, 3) array.
         :param mirror: Should we also draw a version that's mirrored over the XZ plane? [boolean]
         :return: None
 
         E.g. add_line([(0, 0, 0), (1, 0, 0)])
         """
-        for p in points:
-            self.x_line.append(float(p[0]))
-            self.y_line.append(float(p[1]))
-            self.z_line.append(float(p[2]))
-        self.x_line.append(None)
-        self.y_line.append(None)
-        self.z_line.append(None)
+        line = self._as_polyline(points)
+        self.lines.append(line)
         if mirror:
-            reflected_points = [reflect_over_XZ_plane(point) for point in points]
-            self.add_line(
-                points=reflected_points,
-                mirror=False
-            )
+            self.lines.append(reflect_over_XZ_plane(line))
 
     def add_streamline(self,
                        points,
@@ -76,25 +110,35 @@ class Figure3D:
                        ):
         """
         Adds a line (or series of lines) to draw.
-        :param points: an iterable with an arbitrary number of items. Each item is a 3D point, represented as an iterable of length 3.
+        :param points: an iterable with an arbitrary number of items. Each item is a 3D point, represented as an iterable of length 3. Can also be an (N, 3) array.
         :param mirror: Should we also draw a version that's mirrored over the XZ plane? [boolean]
         :return: None
 
         E.g. add_line([(0, 0, 0), (1, 0, 0)])
         """
-        for p in points:
-            self.x_streamline.append(float(p[0]))
-            self.y_streamline.append(float(p[1]))
-            self.z_streamline.append(float(p[2]))
-        self.x_streamline.append(None)
-        self.y_streamline.append(None)
-        self.z_streamline.append(None)
+        streamline = self._as_polyline(points)
+        self.streamlines.append(streamline)
         if mirror:
-            reflected_points = [reflect_over_XZ_plane(point) for point in points]
-            self.add_streamline(
-                points=reflected_points,
-                mirror=False
-            )
+            self.streamlines.append(reflect_over_XZ_plane(streamline))
+
+    def _add_faces(self,
+                   vertices,
+                   triangles,
+                   intensity,
+                   ):
+        """
+        Adds a batch of triangular faces to draw.
+        :param vertices: an (N, 3) array of vertices.
+        :param triangles: an (M, 3) array of indices into `vertices`, one row per triangle.
+        :param intensity: Intensity associated with each vertex. Either a scalar, or an iterable of length N.
+        :return: None
+        """
+        self.face_vertices.append(vertices)
+        self.face_triangles.append(triangles + self.n_face_vertices)
+        self.face_intensities.append(
+            np.broadcast_to(np.array(intensity, dtype=float), (vertices.shape[0],))
+        )
+        self.n_face_vertices += vertices.shape[0]
 
     def add_tri(self,
                 points,
@@ -114,21 +158,17 @@ class Figure3D:
         """
         if not len(points) == 3:
             raise ValueError("'points' must have exactly 3 items!")
-        for p in points:
-            self.x_face.append(float(p[0]))
-            self.y_face.append(float(p[1]))
-            self.z_face.append(float(p[2]))
-            self.intensity_face.append(intensity)
-        indices_added = np.arange(len(self.x_face) - 3, len(self.x_face))
-        self.i_face.append(indices_added[0])
-        self.j_face.append(indices_added[1])
-        self.k_face.append(indices_added[2])
+        points = np.array(points, dtype=float).reshape(3, 3)
+        self._add_faces(
+            vertices=points,
+            triangles=np.array([[0, 1, 2]]),
+            intensity=intensity,
+        )
         if outline:
-            self.add_line(list(points) + [points[0]])
+            self.add_line(points[[0, 1, 2, 0]])
         if mirror:
-            reflected_points = [reflect_over_XZ_plane(point) for point in points]
             self.add_tri(
-                points=reflected_points,
+                points=reflect_over_XZ_plane(points),
                 intensity=intensity,
                 outline=outline,
                 mirror=False
@@ -142,7 +182,7 @@ class Figure3D:
                  ):
         """
         Adds a quadrilateral face to draw. All points should be (approximately) coplanar if you want it to look right.
-        :param points: an iterable with 4 items. Each item is a 3D point, represented as an iterable of length 3. Points should be given in sequential order.
+        :param points: an iterable with 4 items. Each item is a 3D point, represented as an iterable of length 3. Points should be given in sequential order. Can also be a (4, 3) array.
         :param intensity: Intensity associated with this face
         :param outline: Do you want to outline this quad? [boolean]
         :param mirror: Should we also draw a version that's mirrored over the XZ plane? [boolean]
@@ -152,27 +192,51 @@ class Figure3D:
         """
         if not len(points) == 4:
             raise ValueError("'points' must have exactly 4 items!")
-        for p in points:
-            self.x_face.append(float(p[0]))
-            self.y_face.append(float(p[1]))
-            self.z_face.append(float(p[2]))
-            self.intensity_face.append(intensity)
-        indices_added = np.arange(len(self.x_face) - 4, len(self.x_face))
+        self.add_quads(
+            points=np.reshape(np.array(points, dtype=float), (1, 4, 3)),
+            intensity=intensity,
+            outline=outline,
+            mirror=mirror,
+        )
 
-        self.i_face.append(indices_added[0])
-        self.j_face.append(indices_added[1])
-        self.k_face.append(indices_added[2])
+    def add_quads(self,
+                  points,
+                  intensity=0,
+                  outline=True,
+                  mirror=False,
+                  ):
+        """
+        Adds many quadrilateral faces to draw at once. Equivalent to calling add_quad() on each quad, but vectorized.
+        :param points: an array of shape (K, 4, 3). Each points[k] is a quad, given as 4 sequential 3D points.
+        :param intensity: Intensity associated with these faces. Either a scalar, or an iterable of length K.
+        :param outline: Do you want to outline these quads? [boolean]
+        :param mirror: Should we also draw a version that's mirrored over the XZ plane? [boolean]
+        :return: None
+
+        E.g. add_quads(np.array([[(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]]))
+        """
+        points = np.array(points, dtype=float)
+        if not (len(points.shape) == 3 and points.shape[1:] == (4, 3)):
+            raise ValueError("'points' must be an array of shape (K, 4, 3)!")
+        n_quads = points.shape[0]
 
-        self.i_face.append(indices_added[0])
-        self.j_face.append(indices_added[2])
-        self.k_face.append(indices_added[3])
+        # Each quad is split into the triangles (0, 1, 2) and (0, 2, 3).
+        corner_indices = 4 * np.arange(n_quads).reshape(-1, 1, 1)
+        self._add_faces(
+            vertices=points.reshape(-1, 3),
+            triangles=(corner_indices + np.array([[0, 1, 2], [0, 2, 3]])).reshape(-1, 3),
+            intensity=np.repeat(np.broadcast_to(intensity, (n_quads,)), 4),
+        )
 
         if outline:
-            self.add_line(list(points) + [points[0]])
+            # Each outline is the closed loop of the quad's vertices, followed by a row of NaNs to break the line.
+            outlines = np.full((n_quads, 6, 3), np.nan)
+            outlines[:, :4, :] = points
+            outlines[:, 4, :] = points[:, 0, :]
+            self.lines.append(outlines.reshape(-1, 3))
         if mirror:
-            reflected_points = [reflect_over_XZ_plane(point) for point in points]
-            self.add_quad(
-                points=reflected_points,
+            self.add_quads(
+                points=reflect_over_XZ_plane(points.reshape(-1, 3)).reshape(-1, 4, 3),
                 intensity=intensity,
                 outline=outline,
                 mirror=False
@@ -184,17 +248,32 @@ class Figure3D:
              colorbar_title="",
              colorscale="viridis",
              ):
+        def concatenate(arrays, shape, dtype=float):
+            if len(arrays) == 0:
+                return np.zeros(shape, dtype=dtype)
+            return np.concatenate(arrays, axis=0)
+
+        def line_coordinates(lines):
+            # Plotly breaks lines at None, so swap the NaN separator rows back in as None.
+            points = concatenate(lines, (0, 3))
+            return [
+                np.where(np.isnan(coordinate), None, coordinate)
+                for coordinate in points.T
+            ]
+
         # Draw faces
+        face_vertices = concatenate(self.face_vertices, (0, 3))
+        face_triangles = concatenate(self.face_triangles, (0, 3), dtype=int)
         self.fig.add_trace(
             go.Mesh3d(
-                x=self.x_face,
-                y=self.y_face,
-                z=self.z_face,
-                i=self.i_face,
-                j=self.j_face,
-                k=self.k_face,
+                x=face_vertices[:, 0],
+                y=face_vertices[:, 1],
+                z=face_vertices[:, 2],
+                i=face_triangles[:, 0],
+                j=face_triangles[:, 1],
+                k=face_triangles[:, 2],
                 flatshading=False,
-                intensity=self.intensity_face,
+                intensity=concatenate(self.face_intensities, (0,)),
                 colorbar=dict(title=colorbar_title),
                 colorscale=colorscale,
                 showscale=colorbar_title is not None
@@ -202,11 +281,12 @@ class Figure3D:
         )
 
         # Draw lines
+        x_line, y_line, z_line = line_coordinates(self.lines)
         self.fig.add_trace(
             go.Scatter3d(
-                x=self.x_line,
-                y=self.y_line,
-                z=self.z_line,
+                x=x_line,
+                y=y_line,
+                z=z_line,
                 mode='lines',
                 name='',
                 line=dict(color='rgb(0,0,0)', width=3),
@@ -215,11 +295,12 @@ class Figure3D:
         )
 
         # Draw streamlines
+        x_streamline, y_streamline, z_streamline = line_coordinates(self.streamlines)
         self.fig.add_trace(
             go.Scatter3d(
-                x=self.x_streamline,
-                y=self.y_streamline,
-                z=self.z_streamline,
+                x=x_streamline,
+                y=y_streamline,
+                z=z_streamline,
                 mode='lines',
                 name='',
                 line=dict(color='rgba(119,0,255,200)', width=1),